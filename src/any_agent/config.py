@@ -32,6 +32,8 @@ class AgentFramework(str, Enum):
 class MCPStdioParams(BaseModel):
     command: str
     args: Sequence[str]
+    env: Mapping[str, str] | None = None
+    """extra environment variables for the server, which only inherits the MCP SDK defaults such as `PATH` and `HOME`."""
     tools: Sequence[str] | None = None
     client_session_timeout_seconds: float | None = 5
     """the read timeout passed to the MCP ClientSession."""
@@ -49,9 +49,6 @@ class OpenAIAgent(AnyAgent):
         if not agents_available:
             msg = "You need to `pip install 'any-agent[openai]'` to use this agent"
             raise ImportError(msg)
-        if not agents_available:
-            msg = "You need to `pip install openai-agents` to use this agent"
-            raise ImportError(msg)
 
         if not self.managed_agents and not self.config.tools:
             self.config.tools = [
@@ -1,21 +1,50 @@
-from .mcp import (
-    AgnoMCPServer,
-    GoogleMCPServer,
-    LangchainMCPServer,
-    LlamaIndexMCPServer,
-    MCPServer,
-    MCPServerBase,
-    OpenAIMCPServer,
-    SmolagentsMCPServer,
-    _get_mcp_server,
-)
-from .user_interaction import (
-    ask_user_verification,
-    send_console_message,
-    show_final_answer,
-    show_plan,
-)
-from .web_browsing import search_web, visit_webpage
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_getattr
+from .mcp import MCPServerBase, MCPServerPool
+
+if TYPE_CHECKING:
+    from .mcp import (
+        AgnoMCPServer,
+        GoogleMCPServer,
+        LangchainMCPServer,
+        LlamaIndexMCPServer,
+        MCPServer,
+        OpenAIMCPServer,
+        SmolagentsMCPServer,
+        _get_mcp_server,
+    )
+    from .user_interaction import (
+        aask_user_verification,
+        ask_user_verification,
+        send_console_message,
+        show_final_answer,
+        show_plan,
+    )
+    from .web_browsing import search_web, visit_webpage
+
+# The built-in tools and MCP servers are resolved on first access so that
+# importing `any_agent.tools` doesn't pull in the web browsing stack or the
+# MCP SDKs of every installed framework.
+_LAZY = {
+    "AgnoMCPServer": ".mcp",
+    "GoogleMCPServer": ".mcp",
+    "LangchainMCPServer": ".mcp",
+    "LlamaIndexMCPServer": ".mcp",
+    "MCPServer": ".mcp",
+    "OpenAIMCPServer": ".mcp",
+    "SmolagentsMCPServer": ".mcp",
+    "_get_mcp_server": ".mcp",
+    "aask_user_verification": ".user_interaction",
+    "ask_user_verification": ".user_interaction",
+    "send_console_message": ".user_interaction",
+    "show_final_answer": ".user_interaction",
+    "show_plan": ".user_interaction",
+    "search_web": ".web_browsing",
+    "visit_webpage": ".web_browsing",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
 
 __all__ = [
     "AgnoMCPServer",
@@ -24,9 +53,11 @@ __all__ = [
     "LlamaIndexMCPServer",
     "MCPServer",
     "MCPServerBase",
+    "MCPServerPool",
     "OpenAIMCPServer",
     "SmolagentsMCPServer",
     "_get_mcp_server",
+    "aask_user_verification",
     "ask_user_verification",
     "search_web",
     "send_console_message",
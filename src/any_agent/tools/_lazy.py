@@ -0,0 +1,21 @@
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_getattr(package: str, lazy: Mapping[str, str]) -> Callable[[str], Any]:
+    """Return a module `__getattr__` that imports each name in `lazy` on first access.
+
+    `lazy` maps every attribute to the module, relative to `package`, that defines it.
+    """
+
+    def getattr_(name: str) -> Any:
+        if name not in lazy:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(lazy[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return getattr_
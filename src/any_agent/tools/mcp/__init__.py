@@ -1,14 +1,37 @@
-from .frameworks import (
-    AgnoMCPServer,
-    GoogleMCPServer,
-    LangchainMCPServer,
-    LlamaIndexMCPServer,
-    MCPServer,
-    OpenAIMCPServer,
-    SmolagentsMCPServer,
-    _get_mcp_server,
-)
+from typing import TYPE_CHECKING
+
+from any_agent.tools._lazy import lazy_getattr
+
 from .mcp_server import MCPServerBase
+from .mcp_server_pool import MCPServerPool
+
+if TYPE_CHECKING:
+    from .frameworks import (
+        AgnoMCPServer,
+        GoogleMCPServer,
+        LangchainMCPServer,
+        LlamaIndexMCPServer,
+        MCPServer,
+        OpenAIMCPServer,
+        SmolagentsMCPServer,
+        _get_mcp_server,
+    )
+
+# Importing `.frameworks` imports the MCP adapters of every installed
+# framework, so defer it until one of its symbols is actually needed.
+_LAZY = {
+    "AgnoMCPServer": ".frameworks",
+    "GoogleMCPServer": ".frameworks",
+    "LangchainMCPServer": ".frameworks",
+    "LlamaIndexMCPServer": ".frameworks",
+    "MCPServer": ".frameworks",
+    "OpenAIMCPServer": ".frameworks",
+    "SmolagentsMCPServer": ".frameworks",
+    "_get_mcp_server": ".frameworks",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY)
+
 
 __all__ = [
     "AgnoMCPServer",
@@ -17,6 +40,7 @@ __all__ = [
     "LlamaIndexMCPServer",
     "MCPServer",
     "MCPServerBase",
+    "MCPServerPool",
     "OpenAIMCPServer",
     "SmolagentsMCPServer",
     "_get_mcp_server",
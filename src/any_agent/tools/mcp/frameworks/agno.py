@@ -1,10 +1,9 @@
-import os
 from abc import ABC, abstractmethod
 from contextlib import suppress
-from typing import Literal
+from typing import Any, Literal
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
-from any_agent.tools.mcp.mcp_server import MCPServerBase
+from any_agent.tools.mcp.mcp_server import MCPServerBase, _child_env
 
 mcp_available = False
 with suppress(ImportError):
@@ -33,6 +32,13 @@ class AgnoMCPServerBase(MCPServerBase, ABC):
             raise ValueError(msg)
 
         self.tools = [await self._exit_stack.enter_async_context(self.server)]  # type: ignore[arg-type]
+        self._tools_by_name = self._index_tools()
+
+    def _index_tools(self) -> dict[str, Any]:
+        # `tools` only holds the MCPTools toolkit, the tools are its functions
+        if not self.tools:
+            return {}
+        return dict(self.tools[0].functions)  # type: ignore[attr-defined]
 
 
 class AgnoMCPServerStdio(AgnoMCPServerBase):
@@ -43,7 +49,7 @@ class AgnoMCPServerStdio(AgnoMCPServerBase):
         self.server = AgnoMCPTools(
             command=server_params,
             include_tools=list(self.mcp_tool.tools or []),
-            env={**os.environ},
+            env=_child_env(self.mcp_tool.env),
         )
 
         await super()._setup_tools()
@@ -1,10 +1,9 @@
-import os
 from abc import ABC, abstractmethod
 from contextlib import suppress
 from typing import Literal
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
-from any_agent.tools.mcp.mcp_server import MCPServerBase
+from any_agent.tools.mcp.mcp_server import MCPServerBase, _child_env
 
 mcp_available = False
 with suppress(ImportError):
@@ -40,6 +39,7 @@ class GoogleMCPServerBase(MCPServerBase, ABC):
         self.tools = await self.server.load_tools()
 
         self.tools = self._filter_tools(self.tools)
+        self._tools_by_name = self._index_tools()
 
 
 class GoogleMCPServerStdio(GoogleMCPServerBase):
@@ -49,7 +49,7 @@ class GoogleMCPServerStdio(GoogleMCPServerBase):
         params = GoogleStdioServerParameters(
             command=self.mcp_tool.command,
             args=list(self.mcp_tool.args),
-            env={**os.environ},
+            env=_child_env(self.mcp_tool.env),
         )
         self.server = GoogleMCPToolset(connection_params=params)
 
@@ -1,11 +1,10 @@
-import os
 from abc import ABC, abstractmethod
 from contextlib import suppress
 from datetime import timedelta
 from typing import Any, Literal
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
-from any_agent.tools.mcp.mcp_server import MCPServerBase
+from any_agent.tools.mcp.mcp_server import MCPServerBase, _child_env
 
 mcp_available = False
 with suppress(ImportError):
@@ -50,6 +49,7 @@ class LangchainMCPServerBase(MCPServerBase, ABC):
         self.tools = await load_mcp_tools(session)
 
         self.tools = self._filter_tools(self.tools)
+        self._tools_by_name = self._index_tools()
 
 
 class LangchainMCPServerStdio(LangchainMCPServerBase):
@@ -59,7 +59,7 @@ class LangchainMCPServerStdio(LangchainMCPServerBase):
         server_params = StdioServerParameters(
             command=self.mcp_tool.command,
             args=list(self.mcp_tool.args),
-            env={**os.environ},
+            env=_child_env(self.mcp_tool.env),
         )
 
         self.client = stdio_client(server_params)
@@ -1,10 +1,9 @@
-import os
 from abc import ABC, abstractmethod
 from contextlib import suppress
-from typing import Literal
+from typing import Any, Literal
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
-from any_agent.tools.mcp.mcp_server import MCPServerBase
+from any_agent.tools.mcp.mcp_server import MCPServerBase, _child_env
 
 mcp_available = False
 with suppress(ImportError):
@@ -37,6 +36,11 @@ class LlamaIndexMCPServerBase(MCPServerBase, ABC):
         )
 
         self.tools = await mcp_tool_spec.to_tool_list_async()
+        self._tools_by_name = self._index_tools()
+
+    @staticmethod
+    def _tool_name(tool: Any) -> str:
+        return tool.metadata.name  # type: ignore[no-any-return]
 
 
 class LlamaIndexMCPServerStdio(LlamaIndexMCPServerBase):
@@ -46,7 +50,7 @@ class LlamaIndexMCPServerStdio(LlamaIndexMCPServerBase):
         self.client = LlamaIndexMCPClient(
             command_or_url=self.mcp_tool.command,
             args=list(self.mcp_tool.args),
-            env={**os.environ},
+            env=_child_env(self.mcp_tool.env),
         )
 
         await super()._setup_tools()
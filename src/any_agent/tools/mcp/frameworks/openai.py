@@ -3,7 +3,7 @@ from contextlib import suppress
 from typing import Literal
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
-from any_agent.tools.mcp.mcp_server import MCPServerBase
+from any_agent.tools.mcp.mcp_server import MCPServerBase, _child_env
 
 mcp_available = False
 with suppress(ImportError):
@@ -40,6 +40,7 @@ class OpenAIMCPServerBase(MCPServerBase, ABC):
         self.tools = await self.server.list_tools()  # type: ignore[assignment]
 
         self.tools = self._filter_tools(self.tools)
+        self._tools_by_name = self._index_tools()
 
 
 class OpenAIMCPServerStdio(OpenAIMCPServerBase):
@@ -49,11 +50,14 @@ class OpenAIMCPServerStdio(OpenAIMCPServerBase):
         params = OpenAIInternalMCPServerStdioParams(
             command=self.mcp_tool.command,
             args=list(self.mcp_tool.args),
+            env=_child_env(self.mcp_tool.env),
         )
 
         self.server = OpenAIInternalMCPServerStdio(
             name="OpenAI MCP Server",
             params=params,
+            # The Agent lists the server tools on every run, so cache them.
+            cache_tools_list=True,
         )
 
         await super()._setup_tools()
@@ -66,7 +70,7 @@ class OpenAIMCPServerSse(OpenAIMCPServerBase):
         params = OpenAIInternalMCPServerSseParams(url=self.mcp_tool.url)
 
         self.server = OpenAIInternalMCPServerSse(
-            name="OpenAI MCP Server", params=params
+            name="OpenAI MCP Server", params=params, cache_tools_list=True
         )
 
         await super()._setup_tools()
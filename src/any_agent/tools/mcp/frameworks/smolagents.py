@@ -1,11 +1,10 @@
-import os
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from contextlib import suppress
 from typing import Literal
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
-from any_agent.tools.mcp.mcp_server import MCPServerBase
+from any_agent.tools.mcp.mcp_server import MCPServerBase, _child_env
 
 mcp_available = False
 with suppress(ImportError):
@@ -34,6 +33,7 @@ class SmolagentsMCPServerBase(MCPServerBase, ABC):
             raise ValueError(msg)
 
         self.tools = self._filter_tools(self.smolagent_tools)
+        self._tools_by_name = self._index_tools()
 
 
 class SmolagentsMCPServerStdio(SmolagentsMCPServerBase):
@@ -43,7 +43,7 @@ class SmolagentsMCPServerStdio(SmolagentsMCPServerBase):
         server_parameters = StdioServerParameters(
             command=self.mcp_tool.command,
             args=list(self.mcp_tool.args),
-            env={**os.environ},
+            env=_child_env(self.mcp_tool.env),
         )
         self.smolagent_tools = self._exit_stack.enter_context(
             MCPClient(server_parameters)
@@ -1,12 +1,84 @@
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import AsyncExitStack
-from textwrap import dedent
+from collections.abc import Coroutine, Mapping, Sequence
+from contextlib import AsyncExitStack, suppress
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from any_agent.config import AgentFramework, MCPParams, Tool
+from any_agent.config import AgentFramework, MCPParams, MCPStdioParams, Tool
+from any_agent.logging import logger
+
+_MISSING_TOOLS_MSG = (
+    "Could not find all requested tools in the MCP server:\nRequested: {}\nMissing: {}"
+)
+
+
+def _child_env(extra: Mapping[str, str] | None = None) -> dict[str, str]:
+    # Stdio servers shouldn't see the whole environment (and any secrets in it)
+    # of the current process, only the variables the MCP SDK passes by default.
+    # Reading it on each call keeps later changes (e.g. to PATH) visible.
+    from mcp.client.stdio import get_default_environment
+
+    return get_default_environment() | dict(extra or {})
+
+
+def _server_location(mcp_tool: MCPParams) -> str:
+    # Identifies a server in logs without its headers or env, which may hold secrets
+    return mcp_tool.command if isinstance(mcp_tool, MCPStdioParams) else mcp_tool.url
+
+
+async def _close_mcp_servers(mcp_servers: Sequence["MCPServerBase"]) -> None:
+    # Close every server even if some fail to close, logging the failures
+    results = await asyncio.gather(
+        *(mcp_server.aclose() for mcp_server in mcp_servers), return_exceptions=True
+    )
+    for mcp_server, result in zip(mcp_servers, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(
+                "Failed to close MCP server %s: %s",
+                _server_location(mcp_server.mcp_tool),
+                result,
+            )
+
+
+def _request_close(
+    loop: asyncio.AbstractEventLoop, close_requested: asyncio.Event
+) -> None:
+    # Finalizers run wherever the server is collected, maybe after the loop closed
+    with suppress(RuntimeError):
+        loop.call_soon_threadsafe(close_requested.set)
+
+
+# Strong references to the running owner tasks, which the event loop only keeps weakly.
+_owner_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _own(
+    setup: Coroutine[Any, Any, None],
+    exit_stack: AsyncExitStack,
+    close_requested: asyncio.Event,
+    ready: asyncio.Future[None],
+) -> None:
+    # Enters and exits everything opened during setup on this same task. Only
+    # the setup coroutine refers to the server, and it is done by the time this
+    # waits to close it.
+    try:
+        async with exit_stack:
+            try:
+                await setup
+            except Exception as e:
+                # Report the setup error itself, rather than however closing wraps it
+                if not ready.cancelled():
+                    ready.set_exception(e)
+                return
+            if not ready.cancelled():
+                ready.set_result(None)
+            await close_requested.wait()
+    finally:
+        # Don't leave the caller waiting if setup was cancelled
+        ready.cancel()
 
 
 class MCPServerBase(BaseModel, ABC):
@@ -16,7 +88,10 @@ class MCPServerBase(BaseModel, ABC):
     libraries: str = ""
 
     _exit_stack: AsyncExitStack = PrivateAttr(default_factory=AsyncExitStack)
+    _close_requested: asyncio.Event = PrivateAttr(default_factory=asyncio.Event)
+    _owner: asyncio.Task[None] | None = PrivateAttr(default=None)
     tools: Sequence[Tool] = Field(default_factory=list)
+    _tools_by_name: dict[str, Any] = PrivateAttr(default_factory=dict)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -26,6 +101,60 @@ class MCPServerBase(BaseModel, ABC):
     @abstractmethod
     async def _setup_tools(self) -> None: ...
 
+    async def _start(self) -> None:
+        """Set up the server on a dedicated owner task.
+
+        The adapters enter anyio cancel scopes during setup, which have to be
+        exited from the task that entered them. The owner task keeps them open
+        until `aclose` is called (or the server is garbage collected) and then
+        closes them itself, so the server can
+        be closed from any task (e.g. after the sync API ran its setup in a
+        task of its own).
+        """
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        self._owner = loop.create_task(
+            _own(self._setup_tools(), self._exit_stack, self._close_requested, ready)
+        )
+        _owner_tasks.add(self._owner)
+        self._owner.add_done_callback(_owner_tasks.discard)
+        # Close the server once nothing uses it anymore, even without `aclose`
+        weakref.finalize(self, _request_close, loop, self._close_requested)
+        await ready
+
+    async def aclose(self) -> None:
+        """Close the server and release everything opened during setup.
+
+        Stdio servers are shared through `MCPServerPool`, so closing one also
+        closes it for every other agent using it: for those, only call this
+        (or `MCPServerPool.aclose_all`) once all agents are done, e.g. on shutdown.
+        """
+        self._close_requested.set()
+        if self._owner is None:
+            await self._exit_stack.aclose()
+        else:
+            await self._owner
+
+    def get_tool(self, name: str) -> Any:
+        """Return the tool called `name`, among the tools found during setup.
+
+        Raises:
+            KeyError: If the server doesn't provide a tool called `name`.
+
+        """
+        return self._tools_by_name[name]
+
+    def _index_tools(self) -> dict[str, Any]:
+        # Called by each `_setup_tools` right after it sets `tools`
+        tools_by_name: dict[str, Any] = {}
+        for tool in self.tools:
+            tools_by_name.setdefault(self._tool_name(tool), tool)
+        return tools_by_name
+
+    @staticmethod
+    def _tool_name(tool: Any) -> str:
+        return tool.name  # type: ignore[no-any-return]
+
     @abstractmethod
     def _check_dependencies(self) -> None:
         if self.mcp_available:
@@ -36,15 +165,18 @@ class MCPServerBase(BaseModel, ABC):
 
     def _filter_tools(self, tools: Sequence[Any]) -> Sequence[Any]:
         # Only add the tools listed in mcp_tool['tools'] if specified
-        requested_tools = list(self.mcp_tool.tools or [])
+        requested_tools = set(self.mcp_tool.tools or [])
         if not requested_tools:
             return tools
-        tools = [tool for tool in tools if tool.name in requested_tools]
-        if len(tools) != len(requested_tools):
-            tool_names = [tool.name for tool in tools]
-            raise ValueError(
-                dedent(f"""Could not find all requested tools in the MCP server:
-                            Requested: {requested_tools}
-                            Set:   {tool_names}"""),
+        # Keep the first tool for each requested name, dropping duplicates
+        found_tools: dict[str, Any] = {}
+        for tool in tools:
+            if tool.name in requested_tools:
+                found_tools.setdefault(tool.name, tool)
+        missing_tools = requested_tools - found_tools.keys()
+        if missing_tools:
+            msg = _MISSING_TOOLS_MSG.format(
+                sorted(requested_tools), sorted(missing_tools)
             )
-        return tools
+            raise ValueError(msg)
+        return list(found_tools.values())
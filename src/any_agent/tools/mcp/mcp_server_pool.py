@@ -0,0 +1,71 @@
+import asyncio
+from typing import ClassVar
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+from any_agent.config import AgentFramework, MCPStdioParams
+
+from .mcp_server import MCPServerBase, _close_mcp_servers
+
+_PoolKey = tuple[AgentFramework, str]
+
+
+class MCPServerPool:
+    """Share stdio MCP servers between agents that use the same parameters.
+
+    Setting up a stdio server spawns a subprocess and performs the MCP
+    handshake, so each server is set up once and reused by every agent that
+    asks for the same `MCPStdioParams` and framework.
+
+    The underlying sessions are bound to the event loop that opened them,
+    so servers are pooled per event loop. The pool only holds weak references:
+    a server is dropped, and closed, once no agent uses it anymore. The pool
+    doesn't count users, so `aclose_all` is meant for shutdown, once every
+    agent is done.
+    """
+
+    _servers: ClassVar[
+        WeakKeyDictionary[
+            asyncio.AbstractEventLoop, WeakValueDictionary[_PoolKey, MCPServerBase]
+        ]
+    ] = WeakKeyDictionary()
+    _locks: ClassVar[
+        WeakKeyDictionary[
+            asyncio.AbstractEventLoop, WeakValueDictionary[_PoolKey, asyncio.Lock]
+        ]
+    ] = WeakKeyDictionary()
+
+    @classmethod
+    async def acquire(
+        cls, mcp_tool: MCPStdioParams, agent_framework: AgentFramework
+    ) -> MCPServerBase:
+        """Return a set up server for `mcp_tool`, setting it up on first use."""
+        from .frameworks import _get_mcp_server
+
+        loop = asyncio.get_running_loop()
+        servers = cls._servers.setdefault(loop, WeakValueDictionary())
+        locks = cls._locks.setdefault(loop, WeakValueDictionary())
+        key = (agent_framework, mcp_tool.model_dump_json())
+        # Concurrent requests for the same server wait for a single setup. Each
+        # waiter holds the lock, so it is only dropped once no request needs it.
+        async with locks.setdefault(key, asyncio.Lock()):
+            mcp_server = servers.get(key)
+            if mcp_server is None:
+                mcp_server = _get_mcp_server(mcp_tool, agent_framework)
+                await mcp_server._start()
+                servers[key] = mcp_server
+        return mcp_server
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Close every server pooled on the running event loop.
+
+        The servers are closed for every agent using them, so this is meant for
+        shutdown. Each server is closed by the task that set it up, see
+        `MCPServerBase._start`.
+        """
+        loop = asyncio.get_running_loop()
+        servers = cls._servers.get(loop, WeakValueDictionary())
+        # Close every server before dropping them, even if some fail to close
+        await _close_mcp_servers(list(servers.values()))
+        cls._servers.pop(loop, None)
+        cls._locks.pop(loop, None)
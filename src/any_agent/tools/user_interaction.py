@@ -1,3 +1,5 @@
+import asyncio
+
 from any_agent.logging import logger
 
 
@@ -7,8 +9,11 @@ def show_plan(plan: str) -> str:
     Args:
         plan: The current plan.
 
+    Returns:
+        str: The same plan, so the result can be passed on.
+
     """
-    logger.info(f"Current plan: {plan}")
+    logger.info("Current plan: %s", plan)
     return plan
 
 
@@ -18,8 +23,11 @@ def show_final_answer(answer: str) -> str:
     Args:
         answer: The final answer.
 
+    Returns:
+        str: The same answer, so the result can be passed on.
+
     """
-    logger.info(f"Final answer: {answer}")
+    logger.info("Final answer: %s", answer)
     return answer
 
 
@@ -29,10 +37,29 @@ def ask_user_verification(query: str) -> str:
     Args:
         query: The question that requires verification.
 
+    Returns:
+        str: The user's answer.
+
     """
     return input(f"{query} => Type your answer here:")
 
 
+async def aask_user_verification(query: str) -> str:
+    """Asks user to verify the given `query`.
+
+    Unlike `ask_user_verification`, waiting for the answer doesn't block the event loop.
+
+    Args:
+        query: The question that requires verification.
+
+    Returns:
+        str: The user's answer.
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, input, f"{query} => Type your answer here:")
+
+
 def send_console_message(user: str, query: str) -> str:
     """Send the specified user a message via console and returns their response.
 
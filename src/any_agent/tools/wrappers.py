@@ -1,13 +1,14 @@
+import asyncio
+import importlib
 import inspect
 from collections.abc import Callable, Sequence
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Any
 
-from any_agent.config import AgentFramework, MCPParams, Tool
-from any_agent.tools import (
-    MCPServerBase,
-    _get_mcp_server,
-)
+from any_agent.config import AgentFramework, MCPParams, MCPStdioParams, Tool
+from any_agent.logging import logger
+from any_agent.tools import MCPServerBase, MCPServerPool
+from any_agent.tools.mcp.mcp_server import _close_mcp_servers, _server_location
 
 if TYPE_CHECKING:
     from agents import Tool as AgentTool
@@ -44,6 +45,11 @@ def _wrap_tool_smolagents(tool: "Tool | SmolagentsTool") -> "SmolagentsTool":
     if isinstance(tool, SmolagentsTool):
         return tool
 
+    # smolagents calls tools synchronously and would get back a coroutine
+    if inspect.iscoroutinefunction(tool):
+        msg = f"Tool {tool} is async, which is not supported by smolagents"
+        raise ValueError(msg)
+
     # this wrapping needed until https://github.com/huggingface/smolagents/pull/1203 is merged and released
     @wraps(tool)  # type: ignore[arg-type]
     def wrapped_function(*args, **kwargs) -> Any:  # type: ignore[no-untyped-def]
@@ -110,6 +116,70 @@ def verify_callable(tool: Callable[..., Any]) -> None:
             raise ValueError(msg)
 
 
+# Bounded so that configs built from many dynamic paths can't grow it forever.
+@lru_cache(maxsize=512)
+def _resolve_tool(tool_path: str) -> Callable[..., Any]:
+    """Import the tool referenced by a dotted path such as `any_agent.tools.search_web`."""
+    if "." not in tool_path:
+        msg = f"Tool {tool_path} needs to be a dotted path such as `any_agent.tools.search_web`"
+        raise ValueError(msg)
+    module_name, tool_name = tool_path.rsplit(".", 1)
+    try:
+        return getattr(importlib.import_module(module_name), tool_name)  # type: ignore[no-any-return]
+    except (ImportError, AttributeError) as e:
+        msg = f"Tool {tool_path} could not be imported: {e}"
+        raise ValueError(msg) from e
+
+
+async def _setup_mcp_server(
+    mcp_tool: MCPParams, agent_framework: AgentFramework
+) -> MCPServerBase:
+    # MCP adapters are usually implemented as context managers.
+    # We wrap the server using `MCPServerBase` so the
+    # tools can be used as any other callable.
+    if isinstance(mcp_tool, MCPStdioParams):
+        # Stdio servers are shared to avoid respawning the subprocess.
+        return await MCPServerPool.acquire(mcp_tool, agent_framework)
+
+    from any_agent.tools.mcp.frameworks import _get_mcp_server
+
+    mcp_server = _get_mcp_server(mcp_tool, agent_framework)
+    await mcp_server._start()
+    return mcp_server
+
+
+async def _setup_mcp_servers(
+    mcp_tools: Sequence[MCPParams], agent_framework: AgentFramework
+) -> list[MCPServerBase]:
+    # Servers are independent, so set them up concurrently, each on its own
+    # owner task. A failing server doesn't cancel its siblings; every failure
+    # is logged and the first one raised.
+    results = await asyncio.gather(
+        *(_setup_mcp_server(mcp_tool, agent_framework) for mcp_tool in mcp_tools),
+        return_exceptions=True,
+    )
+    mcp_servers = list[MCPServerBase]()
+    errors = list[BaseException]()
+    for mcp_tool, result in zip(mcp_tools, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("Failed to set up MCP server %s", _server_location(mcp_tool))
+            errors.append(result)
+        else:
+            mcp_servers.append(result)
+    if errors:
+        # Failing servers were already closed by their owner task. Pooled
+        # servers may be shared with other agents, so only close our own.
+        await _close_mcp_servers(
+            [
+                mcp_server
+                for mcp_server in mcp_servers
+                if not isinstance(mcp_server.mcp_tool, MCPStdioParams)
+            ]
+        )
+        raise errors[0]
+    return mcp_servers
+
+
 async def _wrap_tools(
     tools: Sequence[Tool],
     agent_framework: AgentFramework,
@@ -117,16 +187,13 @@ async def _wrap_tools(
     wrapper = WRAPPERS[agent_framework]
 
     wrapped_tools = list[Tool]()
-    mcp_servers = list[MCPServerBase]()
+    mcp_tools = list[MCPParams]()
     for tool in tools:
+        if isinstance(tool, str):
+            tool = _resolve_tool(tool)
         # if it's MCPStdioParams or MCPSseParams, we need to wrap it in a server
         if isinstance(tool, MCPParams):
-            # MCP adapters are usually implemented as context managers.
-            # We wrap the server using `MCPServerBase` so the
-            # tools can be used as any other callable.
-            mcp_server = _get_mcp_server(tool, agent_framework)
-            await mcp_server._setup_tools()
-            mcp_servers.append(mcp_server)
+            mcp_tools.append(tool)
         elif callable(tool):
             verify_callable(tool)
             wrapped_tools.append(wrapper(tool))
@@ -134,4 +201,6 @@ async def _wrap_tools(
             msg = f"Tool {tool} needs to be of type `MCPStdioParams`, `str` or `callable` but is {type(tool)}"
             raise ValueError(msg)
 
+    mcp_servers = await _setup_mcp_servers(mcp_tools, agent_framework)
+
     return wrapped_tools, mcp_servers
@@ -1,3 +1,4 @@
+from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,89 +13,97 @@ from any_agent.tools import (
 )
 
 
-def test_load_openai_default() -> None:
-    mock_agent = MagicMock()
-    mock_function_tool = MagicMock()
-    mock_litellm_model = MagicMock()
+# The mocks are built once per module and reset after every test.
+@pytest.fixture(scope="module")
+def mock_agent() -> MagicMock:
+    return MagicMock()
 
-    with (
-        patch("any_agent.frameworks.openai.Agent", mock_agent),
-        patch("agents.function_tool", mock_function_tool),
-        patch("any_agent.frameworks.openai.LitellmModel", mock_litellm_model),
-    ):
-        AnyAgent.create(AgentFramework.OPENAI, AgentConfig(model_id="gpt-4o"))
 
-        mock_litellm_model.assert_called_once_with(
-            model="gpt-4o",
-            base_url=None,
-            api_key=None,
-        )
-        mock_agent.assert_called_once_with(
-            name="any_agent",
-            model=mock_litellm_model.return_value,
-            instructions=None,
-            handoffs=[],
-            tools=[mock_function_tool(search_web), mock_function_tool(visit_webpage)],
-            mcp_servers=[],
-        )
+@pytest.fixture(scope="module")
+def mock_function_tool() -> MagicMock:
+    return MagicMock()
 
 
-def test_openai_with_api_base() -> None:
-    mock_agent = MagicMock()
-    litllm_model_mock = MagicMock()
-    with (
-        patch("any_agent.frameworks.openai.Agent", mock_agent),
-        patch(
-            "any_agent.frameworks.openai.LitellmModel",
-            litllm_model_mock,
-        ),
-    ):
-        AnyAgent.create(
-            AgentFramework.OPENAI,
-            AgentConfig(model_id="gpt-4o", model_args={}, api_base="FOO"),
-        )
-        litllm_model_mock.assert_called_once_with(
-            model="gpt-4o",
-            base_url="FOO",
-            api_key=None,
-        )
+@pytest.fixture(scope="module")
+def mock_litellm_model() -> MagicMock:
+    return MagicMock()
 
 
-def test_openai_with_api_key() -> None:
-    mock_agent = MagicMock()
-    litellm_model_mock = MagicMock()
+@pytest.fixture(autouse=True)
+def _patch_openai(
+    mock_agent: MagicMock,
+    mock_function_tool: MagicMock,
+    mock_litellm_model: MagicMock,
+) -> Generator[None]:
     with (
-        patch("any_agent.frameworks.openai.Agent", mock_agent),
-        patch(
-            "any_agent.frameworks.openai.LitellmModel",
-            litellm_model_mock,
+        patch.multiple(
+            "any_agent.frameworks.openai",
+            Agent=mock_agent,
+            LitellmModel=mock_litellm_model,
         ),
+        patch("agents.function_tool", mock_function_tool),
     ):
-        AnyAgent.create(
-            AgentFramework.OPENAI,
-            AgentConfig(model_id="gpt-4o", model_args={}, api_key="FOO"),
-        )
-        litellm_model_mock.assert_called_once_with(
-            model="gpt-4o",
-            base_url=None,
-            api_key="FOO",
-        )
-
-
-def test_load_openai_with_mcp_server() -> None:
-    mock_agent = MagicMock()
-    mock_function_tool = MagicMock()
+        yield
+    for mock in (mock_agent, mock_function_tool, mock_litellm_model):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+def test_load_openai_default(
+    mock_agent: MagicMock,
+    mock_function_tool: MagicMock,
+    mock_litellm_model: MagicMock,
+) -> None:
+    AnyAgent.create(AgentFramework.OPENAI, AgentConfig(model_id="gpt-4o"))
+
+    mock_litellm_model.assert_called_once_with(
+        model="gpt-4o",
+        base_url=None,
+        api_key=None,
+    )
+    mock_agent.assert_called_once_with(
+        name="any_agent",
+        model=mock_litellm_model.return_value,
+        instructions=None,
+        handoffs=[],
+        tools=[mock_function_tool(search_web), mock_function_tool(visit_webpage)],
+        mcp_servers=[],
+    )
+
+
+def test_openai_with_api_base(mock_litellm_model: MagicMock) -> None:
+    AnyAgent.create(
+        AgentFramework.OPENAI,
+        AgentConfig(model_id="gpt-4o", model_args={}, api_base="FOO"),
+    )
+    mock_litellm_model.assert_called_once_with(
+        model="gpt-4o",
+        base_url="FOO",
+        api_key=None,
+    )
+
+
+def test_openai_with_api_key(mock_litellm_model: MagicMock) -> None:
+    AnyAgent.create(
+        AgentFramework.OPENAI,
+        AgentConfig(model_id="gpt-4o", model_args={}, api_key="FOO"),
+    )
+    mock_litellm_model.assert_called_once_with(
+        model="gpt-4o",
+        base_url=None,
+        api_key="FOO",
+    )
+
+
+def test_load_openai_with_mcp_server(
+    mock_agent: MagicMock,
+    mock_function_tool: MagicMock,
+    mock_litellm_model: MagicMock,
+) -> None:
     mock_mcp_server = MagicMock()
     mock_mcp_server.server = MagicMock()
-    mock_litellm_model = MagicMock()
     mock_wrap_tools = MagicMock()
 
-    with (
-        patch("any_agent.frameworks.openai.Agent", mock_agent),
-        patch("agents.function_tool", mock_function_tool),
-        patch("any_agent.frameworks.openai.LitellmModel", mock_litellm_model),
-        patch.object(AnyAgent, "_load_tools", mock_wrap_tools),
-    ):
+    with patch.object(AnyAgent, "_load_tools", mock_wrap_tools):
 
         async def side_effect(self):  # type: ignore[no-untyped-def]
             return (
@@ -129,91 +138,82 @@ def test_load_openai_with_mcp_server() -> None:
         )
 
 
-def test_load_openai_multiagent() -> None:
-    mock_agent = MagicMock()
-    mock_function_tool = MagicMock()
-    mock_litellm_model = MagicMock()
-    mock_litellm_model.return_value = MagicMock()
-    with (
-        patch("any_agent.frameworks.openai.Agent", mock_agent),
-        patch("agents.function_tool", mock_function_tool),
-        patch("any_agent.frameworks.openai.LitellmModel", mock_litellm_model),
-    ):
-        main_agent = AgentConfig(
-            model_id="o3-mini",
-        )
-
-        managed_agents = [
-            AgentConfig(
-                model_id="gpt-4o-mini",
-                name="user-verification-agent",
-                tools=[ask_user_verification],
-            ),
-            AgentConfig(
-                model_id="gpt-4o",
-                name="search-web-agent",
-                tools=[
-                    search_web,
-                    visit_webpage,
-                ],
-            ),
-            AgentConfig(
-                model_id="gpt-4o-mini",
-                name="communication-agent",
-                tools=[show_final_answer],
-                handoff=True,
-            ),
-        ]
+def test_load_openai_multiagent(
+    mock_agent: MagicMock,
+    mock_function_tool: MagicMock,
+    mock_litellm_model: MagicMock,
+) -> None:
+    main_agent = AgentConfig(
+        model_id="o3-mini",
+    )
 
-        AnyAgent.create(
-            AgentFramework.OPENAI,
-            main_agent,
-            managed_agents=managed_agents,
-        )
-        mock_litellm_model.assert_any_call(
-            model="gpt-4o-mini", base_url=None, api_key=None
-        )
-        mock_agent.assert_any_call(
-            model=mock_litellm_model.return_value,
-            instructions=None,
+    managed_agents = [
+        AgentConfig(
+            model_id="gpt-4o-mini",
             name="user-verification-agent",
-            tools=[
-                mock_function_tool(ask_user_verification),
-            ],
-            mcp_servers=[],
-        )
-        mock_litellm_model.assert_any_call(model="gpt-4o", base_url=None, api_key=None)
-        mock_agent.assert_any_call(
-            model=mock_litellm_model.return_value,
-            instructions=None,
+            tools=[ask_user_verification],
+        ),
+        AgentConfig(
+            model_id="gpt-4o",
             name="search-web-agent",
-            tools=[mock_function_tool(search_web), mock_function_tool(visit_webpage)],
-            mcp_servers=[],
-        )
-
-        mock_litellm_model.assert_any_call(
-            model="gpt-4o-mini", base_url=None, api_key=None
-        )
-        mock_agent.assert_any_call(
-            model=mock_litellm_model.return_value,
-            instructions=None,
-            name="communication-agent",
-            tools=[mock_function_tool(show_final_answer)],
-            mcp_servers=[],
-        )
-
-        mock_litellm_model.assert_any_call(model="o3-mini", base_url=None, api_key=None)
-        mock_agent.assert_any_call(
-            model=mock_litellm_model.return_value,
-            instructions=None,
-            name="any_agent",
-            handoffs=[mock_agent.return_value],
             tools=[
-                mock_agent.return_value.as_tool.return_value,
-                mock_agent.return_value.as_tool.return_value,
+                search_web,
+                visit_webpage,
             ],
-            mcp_servers=[],
-        )
+        ),
+        AgentConfig(
+            model_id="gpt-4o-mini",
+            name="communication-agent",
+            tools=[show_final_answer],
+            handoff=True,
+        ),
+    ]
+
+    AnyAgent.create(
+        AgentFramework.OPENAI,
+        main_agent,
+        managed_agents=managed_agents,
+    )
+    mock_litellm_model.assert_any_call(model="gpt-4o-mini", base_url=None, api_key=None)
+    mock_agent.assert_any_call(
+        model=mock_litellm_model.return_value,
+        instructions=None,
+        name="user-verification-agent",
+        tools=[
+            mock_function_tool(ask_user_verification),
+        ],
+        mcp_servers=[],
+    )
+    mock_litellm_model.assert_any_call(model="gpt-4o", base_url=None, api_key=None)
+    mock_agent.assert_any_call(
+        model=mock_litellm_model.return_value,
+        instructions=None,
+        name="search-web-agent",
+        tools=[mock_function_tool(search_web), mock_function_tool(visit_webpage)],
+        mcp_servers=[],
+    )
+
+    mock_litellm_model.assert_any_call(model="gpt-4o-mini", base_url=None, api_key=None)
+    mock_agent.assert_any_call(
+        model=mock_litellm_model.return_value,
+        instructions=None,
+        name="communication-agent",
+        tools=[mock_function_tool(show_final_answer)],
+        mcp_servers=[],
+    )
+
+    mock_litellm_model.assert_any_call(model="o3-mini", base_url=None, api_key=None)
+    mock_agent.assert_any_call(
+        model=mock_litellm_model.return_value,
+        instructions=None,
+        name="any_agent",
+        handoffs=[mock_agent.return_value],
+        tools=[
+            mock_agent.return_value.as_tool.return_value,
+            mock_agent.return_value.as_tool.return_value,
+        ],
+        mcp_servers=[],
+    )
 
 
 def test_load_openai_agent_missing() -> None:
@@ -222,16 +222,10 @@ def test_load_openai_agent_missing() -> None:
             AnyAgent.create(AgentFramework.OPENAI, AgentConfig(model_id="gpt-4o"))
 
 
-def test_run_openai_with_custom_args() -> None:
-    mock_agent = MagicMock()
+def test_run_openai_with_custom_args(mock_agent: MagicMock) -> None:
     mock_runner = AsyncMock()
 
-    with (
-        patch("any_agent.frameworks.openai.Runner", mock_runner),
-        patch("any_agent.frameworks.openai.Agent", mock_agent),
-        patch("agents.function_tool"),
-        patch("any_agent.frameworks.openai.LitellmModel"),
-    ):
+    with patch("any_agent.frameworks.openai.Runner", mock_runner):
         agent = AnyAgent.create(AgentFramework.OPENAI, AgentConfig(model_id="gpt-4o"))
         agent.run("foo", max_turns=30)
         mock_runner.run.assert_called_once_with(
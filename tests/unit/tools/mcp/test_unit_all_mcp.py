@@ -1,10 +1,12 @@
 # pylint: disable=unused-argument, unused-variable
 from collections.abc import Sequence
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from any_agent.config import AgentFramework, MCPSseParams, MCPStdioParams
 from any_agent.tools import _get_mcp_server
+from any_agent.tools.mcp.mcp_server import _child_env
 
 
 @pytest.mark.asyncio
@@ -25,6 +27,10 @@ async def test_stdio_tool_filtering(
         assert set(server.tools[0].functions.keys()) == set(tools)  # type: ignore[union-attr]
     else:
         assert len(server.tools) == len(tools)  # ignore[arg-type]
+    for tool in tools:
+        assert server.get_tool(tool)
+    with pytest.raises(KeyError):
+        server.get_tool("unknown_tool")
 
 
 @pytest.mark.asyncio
@@ -40,3 +46,35 @@ async def test_sse_tool_filtering(
         assert set(server.tools[0].functions.keys()) == set(tools)  # type: ignore[union-attr]
     else:
         assert len(server.tools) == len(tools)  # ignore[arg-type]
+
+
+def test_filter_tools_reports_missing_tools(stdio_params: MCPStdioParams) -> None:
+    server = _get_mcp_server(stdio_params, AgentFramework.OPENAI)
+    found_tools = [MagicMock(), MagicMock(), MagicMock()]
+    for tool, name in zip(
+        found_tools, ["write_file", "write_file", "unrelated"], strict=True
+    ):
+        tool.name = name
+
+    with pytest.raises(ValueError, match=r"Missing: \['other_tool', 'read_file'\]"):
+        server._filter_tools(found_tools)
+
+
+def test_filter_tools_drops_duplicates(stdio_params: MCPStdioParams) -> None:
+    server = _get_mcp_server(stdio_params, AgentFramework.OPENAI)
+    found_tools = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
+    for tool, name in zip(
+        found_tools,
+        ["write_file", "read_file", "other_tool", "write_file"],
+        strict=True,
+    ):
+        tool.name = name
+
+    assert server._filter_tools(found_tools) == found_tools[:3]
+
+
+def test_child_env_only_inherits_default_variables() -> None:
+    with patch.dict(
+        "os.environ", {"PATH": "/bin", "AWS_SECRET_ACCESS_KEY": "secret"}, clear=True
+    ):
+        assert _child_env({"API_KEY": "key"}) == {"PATH": "/bin", "API_KEY": "key"}
@@ -0,0 +1,84 @@
+import asyncio
+import gc
+import weakref
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from any_agent.config import AgentFramework, MCPStdioParams
+from any_agent.tools import MCPServerPool
+
+
+@pytest.fixture
+def get_mcp_server() -> Generator[MagicMock]:
+    with patch("any_agent.tools.mcp.frameworks._get_mcp_server") as mock_get:
+        mock_get.side_effect = lambda *_: MagicMock(
+            _start=AsyncMock(), aclose=AsyncMock()
+        )
+        yield mock_get
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_server(
+    get_mcp_server: MagicMock, stdio_params: MCPStdioParams
+) -> None:
+    first, second = await asyncio.gather(
+        MCPServerPool.acquire(stdio_params, AgentFramework.OPENAI),
+        MCPServerPool.acquire(stdio_params, AgentFramework.OPENAI),
+    )
+
+    assert first is second
+    get_mcp_server.assert_called_once_with(stdio_params, AgentFramework.OPENAI)
+    first._start.assert_awaited_once()  # type: ignore[attr-defined]
+
+    await MCPServerPool.aclose_all()
+    first.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("get_mcp_server")
+async def test_pool_separates_frameworks(stdio_params: MCPStdioParams) -> None:
+    openai_server = await MCPServerPool.acquire(stdio_params, AgentFramework.OPENAI)
+    google_server = await MCPServerPool.acquire(stdio_params, AgentFramework.GOOGLE)
+
+    assert openai_server is not google_server
+
+    await MCPServerPool.aclose_all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("get_mcp_server")
+async def test_pool_releases_unused_servers(stdio_params: MCPStdioParams) -> None:
+    server = await MCPServerPool.acquire(stdio_params, AgentFramework.OPENAI)
+    server_ref = weakref.ref(server)
+    del server
+    gc.collect()
+
+    assert server_ref() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("get_mcp_server")
+async def test_pool_releases_unused_locks(stdio_params: MCPStdioParams) -> None:
+    server = await MCPServerPool.acquire(stdio_params, AgentFramework.OPENAI)
+    gc.collect()
+
+    assert not MCPServerPool._locks[asyncio.get_running_loop()]
+
+    await server.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_all_servers_when_one_fails(
+    get_mcp_server: MagicMock, stdio_params: MCPStdioParams
+) -> None:
+    openai_server = await MCPServerPool.acquire(stdio_params, AgentFramework.OPENAI)
+    google_server = await MCPServerPool.acquire(stdio_params, AgentFramework.GOOGLE)
+    openai_server.aclose.side_effect = RuntimeError("closing failed")  # type: ignore[attr-defined]
+
+    await MCPServerPool.aclose_all()
+
+    openai_server.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+    google_server.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+    assert asyncio.get_running_loop() not in MCPServerPool._servers
@@ -50,3 +50,16 @@ def test_openai_mcpsse(
 
     server, *_ = agent._mcp_servers
     assert server.mcp_tool == mcp_sse_params_no_tools
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("enter_context_with_transport_and_session")
+async def test_openai_mcp_sse_caches_tools_list(
+    mcp_sse_params_no_tools: MCPSseParams,
+    openai_mcp_sse_server: OpenAIInternalMCPServerSse,
+) -> None:
+    mcp_server = _get_mcp_server(mcp_sse_params_no_tools, AgentFramework.OPENAI)
+    await mcp_server._setup_tools()
+
+    _, kwargs = openai_mcp_sse_server.call_args  # type: ignore[attr-defined]
+    assert kwargs["cache_tools_list"] is True
@@ -0,0 +1,31 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from any_agent.tools import aask_user_verification
+
+
+def slow_input(prompt: str) -> str:
+    time.sleep(0.1)
+    return "yes"
+
+
+@pytest.mark.asyncio
+async def test_aask_user_verification_does_not_block_event_loop() -> None:
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    with patch("builtins.input", slow_input):
+        answer = await aask_user_verification("Proceed?")
+    ticker.cancel()
+
+    assert answer == "yes"
+    assert ticks > 1
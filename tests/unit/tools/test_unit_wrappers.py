@@ -1,10 +1,16 @@
 import asyncio
+import gc
+from collections.abc import Generator
+from typing import ClassVar
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
 
-from any_agent.config import AgentFramework
+from any_agent.config import AgentFramework, MCPParams, MCPSseParams, MCPStdioParams
+from any_agent.tools import MCPServerBase, MCPServerPool
 from any_agent.tools.wrappers import (
+    _resolve_tool,
     _wrap_tool_google,
     _wrap_tool_langchain,
     _wrap_tool_llama_index,
@@ -14,6 +20,13 @@ from any_agent.tools.wrappers import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_resolved_tools() -> Generator[None]:
+    # Resolved tools are cached, don't leak them (or patched attributes) across tests
+    yield
+    _resolve_tool.cache_clear()
+
+
 def foo() -> None:
     """Print bar."""
 
@@ -113,6 +126,13 @@ def test_wrap_tool_smolagents_builtin_tools() -> None:
         wrapper.assert_not_called()
 
 
+def test_wrap_tool_smolagents_async_tools() -> None:
+    from any_agent.tools import aask_user_verification
+
+    with pytest.raises(ValueError, match="is async"):
+        _wrap_tool_smolagents(aask_user_verification)
+
+
 def test_wrap_tool_google() -> None:
     from google.adk.tools import FunctionTool
 
@@ -187,3 +207,182 @@ def test_bad_functions(agent_framework: AgentFramework) -> None:
         return foo
 
     asyncio.run(_wrap_tools([good_function], agent_framework))
+
+
+class TaskGroupServer(MCPServerBase):
+    """Stands in for an MCP server whose setup enters an anyio cancel scope."""
+
+    closed: ClassVar[list[MCPParams]] = []
+
+    def _check_dependencies(self) -> None:
+        pass
+
+    async def _setup_tools(self) -> None:
+        await self._exit_stack.enter_async_context(anyio.create_task_group())
+        self._exit_stack.callback(self.closed.append, self.mcp_tool)
+
+
+@pytest.fixture
+def closed_mcp_tools() -> Generator[list[MCPParams]]:
+    TaskGroupServer.closed.clear()
+    with patch(
+        "any_agent.tools.mcp.frameworks._get_mcp_server",
+        side_effect=lambda mcp_tool, framework: TaskGroupServer(
+            mcp_tool=mcp_tool, framework=framework
+        ),
+    ):
+        yield TaskGroupServer.closed
+
+
+class FailingServer(TaskGroupServer):
+    async def _setup_tools(self) -> None:
+        await super()._setup_tools()
+        msg = "boom"
+        raise ValueError(msg)
+
+
+class FailingCloseServer(TaskGroupServer):
+    async def aclose(self) -> None:
+        await super().aclose()
+        msg = "closing failed"
+        raise RuntimeError(msg)
+
+
+def test_wrap_tools_closes_mcp_servers_on_failure(
+    agent_framework: AgentFramework, closed_mcp_tools: list[MCPParams]
+) -> None:
+    ok_params = MCPSseParams(url="http://localhost:8000/sse")
+    failing_params = MCPSseParams(url="http://localhost:8001/sse")
+    failing_stdio_params = MCPStdioParams(command="uvx", args=["mcp-server-time"])
+    mcp_servers = [
+        TaskGroupServer(mcp_tool=ok_params, framework=agent_framework),
+        FailingServer(mcp_tool=failing_params, framework=agent_framework),
+        FailingServer(mcp_tool=failing_stdio_params, framework=agent_framework),
+    ]
+
+    with patch(
+        "any_agent.tools.mcp.frameworks._get_mcp_server", side_effect=mcp_servers
+    ):
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(
+                _wrap_tools(
+                    [ok_params, failing_params, failing_stdio_params], agent_framework
+                )
+            )
+
+    assert len(closed_mcp_tools) == 3
+    assert all(
+        mcp_tool in closed_mcp_tools
+        for mcp_tool in (ok_params, failing_params, failing_stdio_params)
+    )
+
+
+def test_wrap_tools_closes_remaining_mcp_servers_when_closing_fails(
+    agent_framework: AgentFramework, closed_mcp_tools: list[MCPParams]
+) -> None:
+    mcp_tools = [
+        MCPSseParams(url="http://localhost:8000/sse"),
+        MCPSseParams(url="http://localhost:8001/sse"),
+        MCPSseParams(url="http://localhost:8002/sse"),
+    ]
+    mcp_servers = [
+        FailingCloseServer(mcp_tool=mcp_tools[0], framework=agent_framework),
+        TaskGroupServer(mcp_tool=mcp_tools[1], framework=agent_framework),
+        FailingServer(mcp_tool=mcp_tools[2], framework=agent_framework),
+    ]
+
+    with patch(
+        "any_agent.tools.mcp.frameworks._get_mcp_server", side_effect=mcp_servers
+    ):
+        # The setup error is raised, not the one from closing
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(_wrap_tools(mcp_tools, agent_framework))
+
+    assert len(closed_mcp_tools) == 3
+
+
+def test_wrap_tools_mcp_servers_can_be_closed(
+    agent_framework: AgentFramework, closed_mcp_tools: list[MCPParams]
+) -> None:
+    sse_params = MCPSseParams(url="http://localhost:8000/sse")
+    loop = asyncio.new_event_loop()
+    try:
+        # Like the sync API, which runs each call in a task of its own
+        _, mcp_servers = loop.run_until_complete(
+            _wrap_tools([sse_params], agent_framework)
+        )
+        # Raises if the cancel scope is exited from another task than it was entered
+        loop.run_until_complete(mcp_servers[0].aclose())
+    finally:
+        loop.close()
+
+    assert closed_mcp_tools == [sse_params]
+
+
+def test_wrap_tools_shares_stdio_servers(
+    agent_framework: AgentFramework, closed_mcp_tools: list[MCPParams]
+) -> None:
+    stdio_params = MCPStdioParams(command="uvx", args=["mcp-server-time"])
+    loop = asyncio.new_event_loop()
+    try:
+        _, first = loop.run_until_complete(_wrap_tools([stdio_params], agent_framework))
+        _, second = loop.run_until_complete(
+            _wrap_tools([stdio_params], agent_framework)
+        )
+        assert first[0] is second[0]
+
+        loop.run_until_complete(MCPServerPool.aclose_all())
+    finally:
+        loop.close()
+
+    assert closed_mcp_tools == [stdio_params]
+
+
+def test_wrap_tools_closes_released_mcp_servers(
+    agent_framework: AgentFramework, closed_mcp_tools: list[MCPParams]
+) -> None:
+    stdio_params = MCPStdioParams(command="uvx", args=["mcp-server-time"])
+
+    async def wrap_and_release() -> None:
+        _, mcp_servers = await _wrap_tools([stdio_params], agent_framework)
+        owner = mcp_servers[0]._owner
+        del mcp_servers
+        gc.collect()
+        await asyncio.wait({owner}, timeout=1)  # type: ignore[arg-type]
+        assert closed_mcp_tools == [stdio_params]
+
+    asyncio.run(wrap_and_release())
+
+
+def test_wrap_tools_resolves_tool_paths(agent_framework: AgentFramework) -> None:
+    from any_agent.tools import search_web
+
+    wrapped_tools, _ = asyncio.run(
+        _wrap_tools(["any_agent.tools.search_web"], agent_framework)
+    )
+    expected_tools, _ = asyncio.run(_wrap_tools([search_web], agent_framework))
+
+    assert _resolve_tool("any_agent.tools.search_web") is search_web
+    assert len(wrapped_tools) == len(expected_tools) == 1
+
+
+def test_resolve_tool_is_cached() -> None:
+    tool_paths = ["any_agent.tools.search_web", "any_agent.tools.visit_webpage"] * 3
+
+    resolved = [_resolve_tool(tool_path) for tool_path in tool_paths]
+
+    assert resolved[:2] == resolved[2:4] == resolved[4:]
+    assert _resolve_tool.cache_info().misses == 2
+
+
+def test_resolve_tool_rejects_paths_without_module() -> None:
+    with pytest.raises(ValueError, match="search_web needs to be a dotted path"):
+        _resolve_tool("search_web")
+
+
+@pytest.mark.parametrize(
+    "tool_path", ["any_agent.tools.missing_tool", "missing_module.search_web"]
+)
+def test_resolve_tool_reports_unknown_tools(tool_path: str) -> None:
+    with pytest.raises(ValueError, match=f"Tool {tool_path} could not be imported"):
+        _resolve_tool(tool_path)